@@ -1,10 +1,13 @@
 from ninja import NinjaAPI
 
+from src.api.renderers import ORJSONRenderer
 from src.api.users import router as auth_router
 from src.api.regionals import router as regional_router
 from src.api.cars import router as cars_router
 
-api = NinjaAPI()
+__all__ = ["api"]
+
+api = NinjaAPI(renderer=ORJSONRenderer())
 
 # Include auth routes
 api.add_router("/auth", auth_router)
@@ -14,9 +17,3 @@ api.add_router("/regional", regional_router)
 
 # Include cars routes
 api.add_router("/cars", cars_router)
-
-
-@api.get("/ping", response={200: str})
-def ping(request):
-    """Simple ping endpoint returning plain text."""
-    return "pong"
@@ -80,6 +80,9 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Reuse connections across requests instead of reconnecting every time
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
@@ -121,12 +124,32 @@ USE_TZ = True
 STATIC_URL = "static/"
 
 # Cache configuration for rate limiting
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+# Set REDIS_URL in multi-worker deployments so rate-limit counters (and
+# cached responses) are shared instead of living in each process. Without
+# it, car cache evictions only reach the current process, so other workers
+# can serve stale cars for up to CAR_CACHE_TIMEOUT seconds
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
     }
-}
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+        }
+    }
+RATELIMIT_USE_CACHE = "default"
+
+# Password hashing (argon2id) configuration
+PASSWORD_HASH_ROUNDS = int(os.getenv("PASSWORD_HASH_ROUNDS", "2"))
+PASSWORD_HASH_MEMORY_KIB = int(os.getenv("PASSWORD_HASH_MEMORY_KIB", "19456"))
+# Threads reserved for register/login hashing (defaults to the CPU count)
+AUTH_WORKER_THREADS = int(os.getenv("AUTH_WORKER_THREADS", "0")) or None
 
 # JWT Configuration
 JWT_ALGORITHM = "HS256"
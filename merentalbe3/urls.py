@@ -19,8 +19,10 @@ from django.contrib import admin
 from django.urls import path
 
 from .api import api
+from .views import ping
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("ping", ping, name="ping"),
     path("", api.urls),
 ]
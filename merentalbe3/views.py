@@ -0,0 +1,14 @@
+from django.http import HttpResponse
+
+
+# Static ping body, encoded once at import
+PONG = b"pong"
+
+
+def ping(request):
+    """Simple ping endpoint returning plain text.
+
+    Served as a plain Django view so requests skip ninja's routing and
+    response schema layer entirely.
+    """
+    return HttpResponse(PONG, content_type="text/plain")
@@ -0,0 +1,56 @@
+"""Response cache for single-car reads
+
+Car responses embed their regional's name. Instead of evicting every car of
+a regional when it changes, each entry records its regional's version and
+is ignored once that version moves on.
+"""
+
+import time
+from typing import Iterable, Optional
+
+from django.core.cache import cache
+
+
+# Seconds a cached car response stays valid
+CAR_CACHE_TIMEOUT = 60
+
+
+def car_cache_key(car_id: int) -> str:
+    """Build the cache key for a car response"""
+    return f"car:{car_id}"
+
+
+def regional_version_key(regional_id: int) -> str:
+    """Build the cache key holding a regional's cache version"""
+    return f"regional:{regional_id}:version"
+
+
+async def aget_car(car_id: int) -> Optional[dict]:
+    """Return the cached response for a car, or None if missing or stale"""
+    entry = await cache.aget(car_cache_key(car_id))
+    if entry is None:
+        return None
+    version, payload = entry
+    # A missing version (never set or evicted) also counts as stale
+    current = await cache.aget(regional_version_key(payload["regional"]["id"]))
+    return payload if version == current else None
+
+
+async def aset_car(car_id: int, payload: dict) -> None:
+    """Cache a car response under its regional's current version"""
+    key = regional_version_key(payload["regional"]["id"])
+    await cache.aadd(key, time.time_ns(), timeout=None)
+    version = await cache.aget(key)
+    await cache.aset(car_cache_key(car_id), (version, payload), CAR_CACHE_TIMEOUT)
+
+
+def invalidate_cars(car_ids: Iterable[int]) -> None:
+    """Drop cached responses for the given car IDs"""
+    keys = [car_cache_key(car_id) for car_id in car_ids]
+    if keys:
+        cache.delete_many(keys)
+
+
+def invalidate_regional(regional_id: int) -> None:
+    """Make every cached response for cars in a regional stale"""
+    cache.set(regional_version_key(regional_id), time.time_ns(), timeout=None)
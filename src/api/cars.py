@@ -1,7 +1,15 @@
 """Car API endpoints."""
 
-from ninja import Router
-
+from ninja import Query, Router
+
+from src.api.car_cache import aget_car, aset_car, invalidate_cars
+from src.api.dependencies import (
+    get_create_car_use_case,
+    get_delete_car_use_case,
+    get_get_car_use_case,
+    get_get_cars_use_case,
+    get_update_car_use_case,
+)
 from src.api.schemas.car_dto import (
     CreateCarRequest,
     CreateCarResponse,
@@ -13,49 +21,40 @@ from src.api.schemas.car_dto import (
     DeleteCarResponse,
     MessageResponse,
 )
-from src.application.use_cases.car.create_car import CreateCarUseCase
-from src.application.use_cases.car.get_cars import GetCarByIdUseCase, GetCarsUseCase
-from src.application.use_cases.car.update_car import UpdateCarUseCase
-from src.application.use_cases.car.delete_car import DeleteCarUseCase
-from src.domain.exceptions import DomainValidationError
-from src.infrastructure.repositories.django_car_repository import DjangoCarRepository
-from src.infrastructure.repositories.django_regional_repository import (
-    DjangoRegionalRepository,
+from src.domain.exceptions import (
+    CarNotFoundError,
+    DomainValidationError,
+    PlateAlreadyExistsError,
+    RegionalNotFoundError,
 )
 
 
 router = Router(tags=["Cars"])
 
 
-def _get_repositories():
-    """Dependency injection for repositories."""
-    return DjangoCarRepository(), DjangoRegionalRepository()
-
+def _car_to_payload(car):
+    """Convert Car entity to a plain dict matching CarResponse.
 
-def _car_to_response(car, regionals_by_id):
-    """Convert Car entity to CarResponse DTO.
+    django-ninja validates the whole response in one pass, so no CarResponse
+    is built per car.
 
     Args:
-        car: Car entity to convert
-        regionals_by_id: Dictionary of regionals indexed by ID {id: regional}
+        car: Car entity to convert, with its regional loaded by the repository
     """
-    regional = regionals_by_id.get(car.regional_id)
+    regional = car.regional
     if not regional:
         raise ValueError(f"Regional with ID {car.regional_id} not found")
-    return CarResponse(
-        id=car.id,
-        name=car.name,
-        brand=car.brand,
-        model=car.model,
-        year=car.year,
-        plate_number=car.plate_number,
-        color=car.color,
-        price_per_day=car.price_per_day,
-        regional={
-            "id": car.regional_id,
-            "name": regional.name,
-        },
-    )
+    return {
+        "id": car.id,
+        "name": car.name,
+        "brand": car.brand,
+        "model": car.model,
+        "year": car.year,
+        "plate_number": car.plate_number,
+        "color": car.color,
+        "price_per_day": car.price_per_day,
+        "regional": {"id": regional.id, "name": regional.name},
+    }
 
 
 @router.post(
@@ -70,8 +69,7 @@ def create_car(request, data: CreateCarRequest):
         409: Plate number already exists
     """
     try:
-        cars_repo, regionals_repo = _get_repositories()
-        use_case = CreateCarUseCase(cars_repo, regionals_repo)
+        use_case = get_create_car_use_case()
         created_car = use_case.execute(
             name=data.name,
             brand=data.brand,
@@ -82,85 +80,78 @@ def create_car(request, data: CreateCarRequest):
             price_per_day=data.price_per_day,
             regional_id=data.regional,
         )
-        # Build regionals lookup dict for response conversion
-        regional = regionals_repo.find_by_id(created_car.regional_id)
-        if not regional:
-            return 400, {
-                "message": f"Regional with ID {created_car.regional_id} not found"
-            }
-        regionals_by_id = {regional.id: regional}
         return 201, {
             "message": "Car created successfully",
-            "car": _car_to_response(created_car, regionals_by_id),
+            "car": _car_to_payload(created_car),
         }
+    except PlateAlreadyExistsError as e:
+        return 409, {"message": e.message}
     except DomainValidationError as e:
         return 400, {"message": e.message}
-    except ValueError as e:
-        error_msg = str(e)
-        if "already exists" in error_msg:
-            return 409, {"message": error_msg}
-        return 400, {"message": error_msg}
 
 
 @router.get("/", response={200: GetCarsResponse, 400: MessageResponse})
-def get_cars(request, filters: GetCarsFilterRequest = None):
-    """Get all cars with optional filtering.
+async def get_cars(request, filters: Query[GetCarsFilterRequest]):
+    """Get cars page by page with optional filtering.
 
     Query parameters:
         r: Regional ID
         s: Start date (Unix timestamp)
         e: End date (Unix timestamp)
+        limit: Page size (default 50, max 100)
+        cursor: ID of the last car on the previous page
 
-    All three parameters must be provided together if any is provided.
+    All three filter parameters must be provided together if any is provided.
+    ``next_cursor`` in the response is the cursor for the next page, or null
+    on the last page.
 
     Returns:
         200: List of cars
         400: Invalid filter parameters
     """
     try:
-        cars_repo, regionals_repo = _get_repositories()
-        use_case = GetCarsUseCase(cars_repo)
-        car_list = use_case.execute(
-            regional_id=filters.r if filters else None,
-            start_date=filters.s if filters else None,
-            end_date=filters.e if filters else None,
+        use_case = get_get_cars_use_case()
+        car_list = await use_case.aexecute(
+            regional_id=filters.r,
+            start_date=filters.s,
+            end_date=filters.e,
+            limit=filters.limit,
+            cursor=filters.cursor,
         )
+        next_cursor = car_list[-1].id if len(car_list) == filters.limit else None
 
-        # Fetch all regionals upfront to avoid N+1 queries
-        all_regionals = regionals_repo.find_all()
-        regionals_by_id = {regional.id: regional for regional in all_regionals}
-
+        # Regionals are joined into the car query, so no extra lookups are needed
         return 200, {
-            "cars": [_car_to_response(car, regionals_by_id) for car in car_list]
+            "cars": [_car_to_payload(car) for car in car_list],
+            "next_cursor": next_cursor,
         }
     except ValueError as e:
         return 400, {"message": str(e)}
 
 
 @router.get("/{car_id}", response={200: CarResponse, 404: MessageResponse})
-def get_car_by_id(request, car_id: int):
+async def get_car_by_id(request, car_id: int):
     """Get a car by ID.
 
+    Successful responses are cached for CAR_CACHE_TIMEOUT seconds and
+    invalidated when the car or its regional changes.
+
     Returns:
         200: Car details
         404: Car not found
     """
+    cached = await aget_car(car_id)
+    if cached is not None:
+        return 200, cached
+
     try:
-        cars_repo, regionals_repo = _get_repositories()
-        use_case = GetCarByIdUseCase(cars_repo)
-        retrieved_car = use_case.execute(car_id)
-
-        # Build regionals lookup dict for response conversion
-        regional = regionals_repo.find_by_id(retrieved_car.regional_id)
-        if not regional:
-            return 404, {
-                "message": f"Regional with ID {retrieved_car.regional_id} not found"
-            }
-        regionals_by_id = {regional.id: regional}
-
-        return 200, _car_to_response(retrieved_car, regionals_by_id)
-    except ValueError as e:
-        return 404, {"message": str(e)}
+        use_case = get_get_car_use_case()
+        retrieved_car = await use_case.aexecute(car_id)
+        payload = _car_to_payload(retrieved_car)
+        await aset_car(car_id, payload)
+        return 200, payload
+    except CarNotFoundError as e:
+        return 404, {"message": e.message}
 
 
 @router.put(
@@ -190,31 +181,20 @@ def update_car(request, car_id: int, data: UpdateCarRequest):
         if "regional" in update_fields:
             update_fields["regional_id"] = update_fields.pop("regional")
 
-        cars_repo, regionals_repo = _get_repositories()
-        use_case = UpdateCarUseCase(cars_repo, regionals_repo)
+        use_case = get_update_car_use_case()
         updated_car = use_case.execute(car_id, **update_fields)
-
-        # Build regionals lookup dict for response conversion
-        regional = regionals_repo.find_by_id(updated_car.regional_id)
-        if not regional:
-            return 400, {
-                "message": f"Regional with ID {updated_car.regional_id} not found"
-            }
-        regionals_by_id = {regional.id: regional}
+        invalidate_cars([car_id])
 
         return 200, {
             "message": "Car updated successfully",
-            "car": _car_to_response(updated_car, regionals_by_id),
+            "car": _car_to_payload(updated_car),
         }
+    except (CarNotFoundError, RegionalNotFoundError) as e:
+        return 404, {"message": e.message}
+    except PlateAlreadyExistsError as e:
+        return 409, {"message": e.message}
     except DomainValidationError as e:
         return 400, {"message": e.message}
-    except ValueError as e:
-        error_msg = str(e)
-        if "not found" in error_msg:
-            return 404, {"message": error_msg}
-        if "already exists" in error_msg:
-            return 409, {"message": error_msg}
-        return 400, {"message": error_msg}
 
 
 @router.delete("/{car_id}", response={200: DeleteCarResponse, 404: MessageResponse})
@@ -226,9 +206,9 @@ def delete_car(request, car_id: int):
         404: Car not found
     """
     try:
-        cars_repo, _ = _get_repositories()
-        use_case = DeleteCarUseCase(cars_repo)
+        use_case = get_delete_car_use_case()
         use_case.execute(car_id)
+        invalidate_cars([car_id])
         return 200, {"message": "Car deleted successfully"}
-    except ValueError as e:
-        return 404, {"message": str(e)}
+    except CarNotFoundError as e:
+        return 404, {"message": e.message}
@@ -2,6 +2,10 @@
 
 from functools import lru_cache
 
+from src.application.use_cases.car.create_car import CreateCarUseCase
+from src.application.use_cases.car.delete_car import DeleteCarUseCase
+from src.application.use_cases.car.get_cars import GetCarByIdUseCase, GetCarsUseCase
+from src.application.use_cases.car.update_car import UpdateCarUseCase
 from src.application.use_cases.user.login_user import LoginUserUseCase
 from src.application.use_cases.user.register_user import RegisterUserUseCase
 from src.application.use_cases.regional.create_regional import CreateRegionalUseCase
@@ -9,8 +13,10 @@ from src.application.use_cases.regional.get_regional import GetRegionalUseCase
 from src.application.use_cases.regional.get_regionals import GetRegionalsUseCase
 from src.application.use_cases.regional.update_regional import UpdateRegionalUseCase
 from src.application.use_cases.regional.delete_regional import DeleteRegionalUseCase
+from src.domain.repositories.car_repository import CarRepository
 from src.domain.repositories.user_repository import UserRepository
 from src.domain.repositories.regional_repository import RegionalRepository
+from src.infrastructure.repositories.django_car_repository import DjangoCarRepository
 from src.infrastructure.repositories.django_user_repository import DjangoUserRepository
 from src.infrastructure.repositories.django_regional_repository import (
     DjangoRegionalRepository,
@@ -29,36 +35,79 @@ def get_regional_repository() -> RegionalRepository:
     return DjangoRegionalRepository()
 
 
+@lru_cache()
+def get_car_repository() -> CarRepository:
+    """Get the car repository instance (singleton)"""
+    return DjangoCarRepository()
+
+
+@lru_cache()
 def get_register_use_case() -> RegisterUserUseCase:
-    """Get the register user use case with dependencies injected"""
+    """Get the register user use case with dependencies injected (singleton)"""
     return RegisterUserUseCase(get_user_repository())
 
 
+@lru_cache()
 def get_login_use_case() -> LoginUserUseCase:
-    """Get the login user use case with dependencies injected"""
+    """Get the login user use case with dependencies injected (singleton)"""
     return LoginUserUseCase(get_user_repository())
 
 
+@lru_cache()
 def get_create_regional_use_case() -> CreateRegionalUseCase:
-    """Get the create regional use case with dependencies injected"""
+    """Get the create regional use case with dependencies injected (singleton)"""
     return CreateRegionalUseCase(get_regional_repository())
 
 
+@lru_cache()
 def get_get_regional_use_case() -> GetRegionalUseCase:
-    """Get the get regional use case with dependencies injected"""
+    """Get the get regional use case with dependencies injected (singleton)"""
     return GetRegionalUseCase(get_regional_repository())
 
 
+@lru_cache()
 def get_get_regionals_use_case() -> GetRegionalsUseCase:
-    """Get the get all regionals use case with dependencies injected"""
+    """Get the get all regionals use case with dependencies injected (singleton)"""
     return GetRegionalsUseCase(get_regional_repository())
 
 
+@lru_cache()
 def get_update_regional_use_case() -> UpdateRegionalUseCase:
-    """Get the update regional use case with dependencies injected"""
+    """Get the update regional use case with dependencies injected (singleton)"""
     return UpdateRegionalUseCase(get_regional_repository())
 
 
+@lru_cache()
 def get_delete_regional_use_case() -> DeleteRegionalUseCase:
-    """Get the delete regional use case with dependencies injected"""
+    """Get the delete regional use case with dependencies injected (singleton)"""
     return DeleteRegionalUseCase(get_regional_repository())
+
+
+@lru_cache()
+def get_create_car_use_case() -> CreateCarUseCase:
+    """Get the create car use case with dependencies injected (singleton)"""
+    return CreateCarUseCase(get_car_repository())
+
+
+@lru_cache()
+def get_get_car_use_case() -> GetCarByIdUseCase:
+    """Get the get car by ID use case with dependencies injected (singleton)"""
+    return GetCarByIdUseCase(get_car_repository())
+
+
+@lru_cache()
+def get_get_cars_use_case() -> GetCarsUseCase:
+    """Get the get all cars use case with dependencies injected (singleton)"""
+    return GetCarsUseCase(get_car_repository())
+
+
+@lru_cache()
+def get_update_car_use_case() -> UpdateCarUseCase:
+    """Get the update car use case with dependencies injected (singleton)"""
+    return UpdateCarUseCase(get_car_repository())
+
+
+@lru_cache()
+def get_delete_car_use_case() -> DeleteCarUseCase:
+    """Get the delete car use case with dependencies injected (singleton)"""
+    return DeleteCarUseCase(get_car_repository())
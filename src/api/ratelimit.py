@@ -0,0 +1,159 @@
+"""Rolling-window rate limiting for async views
+
+django-ratelimit's decorator only wraps sync views, and it counts requests
+in fixed windows: a client can spend the whole limit at the end of one
+window and again at the start of the next, doubling it around the
+boundary. This limiter is a sliding-window counter instead. It keeps one
+counter per fixed window and weights the previous window's count by how
+much of it still overlaps the rolling period, so bursts across a window
+boundary are rejected too.
+
+Counters live in the RATELIMIT_USE_CACHE cache, so they are shared across
+workers when that cache is Redis. The client IP honours
+RATELIMIT_IP_META_KEY like django-ratelimit does.
+
+Only the auth endpoints (/auth/register and /auth/login), the
+brute-force targets, use this limiter. The regional endpoints keep
+django-ratelimit's fixed-window ``@ratelimit``; the split is deliberate.
+"""
+
+import hashlib
+import ipaddress
+import time
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from django_ratelimit import ALL
+from django_ratelimit.exceptions import Ratelimited
+
+
+# Seconds per rate period unit
+PERIODS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+
+def _split_rate(rate: str) -> tuple[int, int]:
+    """Parse a rate such as "5/m" or "100/15m" into (limit, period seconds)"""
+    count, _, period = rate.partition("/")
+    multiplier, unit = period[:-1], period[-1:]
+    if unit not in PERIODS:
+        raise ImproperlyConfigured(f"Invalid ratelimit rate: {rate}")
+    return int(count), PERIODS[unit] * int(multiplier or 1)
+
+
+def _client_ip(request) -> str:
+    """Read the client IP from RATELIMIT_IP_META_KEY or REMOTE_ADDR, masked"""
+    ip_meta = getattr(settings, "RATELIMIT_IP_META_KEY", None)
+    if not ip_meta:
+        ip = request.META.get("REMOTE_ADDR")
+    elif callable(ip_meta):
+        ip = ip_meta(request)
+    elif "." in ip_meta:
+        ip = import_string(ip_meta)(request)
+    else:
+        ip = request.META.get(ip_meta)
+    if not ip:
+        raise ImproperlyConfigured("Could not read the client IP address")
+
+    # Group IPv6 clients by network, as one host usually owns a whole /64
+    if ":" in ip:
+        mask = getattr(settings, "RATELIMIT_IPV6_MASK", 64)
+    else:
+        mask = getattr(settings, "RATELIMIT_IPV4_MASK", 32)
+    return str(ipaddress.ip_network(f"{ip}/{mask}", strict=False).network_address)
+
+
+def _client_key(key, group, request) -> str:
+    """Resolve the ratelimit key ("ip" or a callable(group, request))"""
+    if key == "ip":
+        return _client_ip(request)
+    return key(group, request)
+
+
+def is_ratelimited(request, group: str, key, rate: str) -> bool:
+    """Count a request and check it against a rolling window
+
+    The request is counted in the current window, then the estimated number
+    of requests in the last ``period`` seconds is the current count plus the
+    previous window's count scaled by the part of it still in range. A
+    rejected request is uncounted again.
+
+    Args:
+        request: Incoming request
+        group: Counter namespace (one per view)
+        key: "ip" or a callable(group, request) returning the client key
+        rate: Rate string such as "5/m"
+
+    Returns:
+        True if the request exceeds the rate and should be rejected
+    """
+    if not getattr(settings, "RATELIMIT_ENABLE", True):
+        return False
+
+    limit, period = _split_rate(rate)
+    value = hashlib.md5(_client_key(key, group, request).encode()).hexdigest()
+    cache = caches[getattr(settings, "RATELIMIT_USE_CACHE", "default")]
+
+    now = time.time()
+    window = int(now // period)
+    prefix = f"rl:sw:{group}:{value}:"
+    current_key = f"{prefix}{window}"
+
+    # Increment first so concurrent requests never read the same count;
+    # counters outlive their window so they can serve as the previous one
+    if cache.add(current_key, 1, 2 * period + 5):
+        current = 1
+    else:
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            # The counter expired between add() and incr()
+            cache.add(current_key, 1, 2 * period + 5)
+            current = 1
+
+    previous = cache.get(f"{prefix}{window - 1}", 0)
+    overlap = 1 - (now % period) / period
+    if current + previous * overlap <= limit:
+        return False
+
+    # Rejected requests don't use up the allowance
+    try:
+        cache.decr(current_key)
+    except ValueError:
+        pass
+    return True
+
+
+def async_ratelimit(group=None, key=None, rate=None, method=ALL, block=True):
+    """Rolling-window counterpart of ``django_ratelimit.decorators.ratelimit``"""
+
+    def decorator(fn):
+        counter_group = group or f"{fn.__module__}.{fn.__qualname__}"
+        if method == ALL:
+            methods = None
+        elif isinstance(method, str):
+            methods = {method.upper()}
+        else:
+            methods = {m.upper() for m in method}
+
+        @wraps(fn)
+        async def _wrapped(request, *args, **kw):
+            old_limited = getattr(request, "limited", False)
+            ratelimited = False
+            if methods is None or request.method in methods:
+                # The cache backend is sync, so count off the event loop
+                ratelimited = await sync_to_async(is_ratelimited)(
+                    request, counter_group, key, rate
+                )
+            request.limited = ratelimited or old_limited
+            if ratelimited and block:
+                cls = getattr(settings, "RATELIMIT_EXCEPTION_CLASS", Ratelimited)
+                raise (import_string(cls) if isinstance(cls, str) else cls)()
+            return await fn(request, *args, **kw)
+
+        return _wrapped
+
+    return decorator
@@ -1,6 +1,7 @@
 from django_ratelimit.decorators import ratelimit
 from ninja import Router
 
+from src.api.car_cache import invalidate_regional
 from src.api.dependencies import (
     get_create_regional_use_case,
     get_get_regional_use_case,
@@ -9,6 +10,7 @@ from src.api.dependencies import (
     get_delete_regional_use_case,
 )
 from src.application.schemas.result_enums import RegionalErrorCode
+from src.application.use_cases.regional.get_regionals import DEFAULT_PAGE_SIZE
 from src.api.schemas.regional_dto import (
     CreateRegionalRequest,
     UpdateRegionalRequest,
@@ -22,6 +24,10 @@ from src.api.schemas.regional_dto import (
 
 router = Router(tags=["Regional"])
 
+# Regional writes use django-ratelimit's fixed-window limiter. The auth
+# endpoints use the sliding-window async_ratelimit (src/api/ratelimit.py)
+# because they are the brute-force targets.
+
 
 @router.post(
     "",
@@ -52,20 +58,25 @@ def create_regional(request, payload: CreateRegionalRequest):
 
 @router.get(
     "",
-    response={200: RegionalListResponse},
+    response={200: RegionalListResponse, 400: MessageResponse},
 )
-def get_regionals(request):
+def get_regionals(request, limit: int = DEFAULT_PAGE_SIZE, cursor: int = None):
     """Get all regionals
 
-    Returns a list of all regionals.
+    Returns a page of regionals ordered by ID. Pass the returned
+    next_cursor as cursor to fetch the following page.
     """
     use_case = get_get_regionals_use_case()
-    result = use_case.execute()
+    result = use_case.execute(limit=limit, cursor=cursor)
+
+    if not result.success:
+        return 400, {"message": result.message}
 
     return 200, {
         "regionals": [
             {"id": regional.id, "name": regional.name} for regional in result.regionals
-        ]
+        ],
+        "next_cursor": result.next_cursor,
     }
 
 
@@ -105,6 +116,8 @@ def update_regional(request, regional_id: int, payload: UpdateRegionalRequest):
     result = use_case.execute(regional_id, payload.name)
 
     if result.success:
+        # Cached car responses embed the regional name
+        invalidate_regional(regional_id)
         return 200, {
             "message": result.message,
             "regional": {
@@ -133,6 +146,7 @@ def delete_regional(request, regional_id: int):
     result = use_case.execute(regional_id)
 
     if result.success:
+        invalidate_regional(regional_id)
         return 200, {"message": result.message}
     else:
         return 404, {"message": result.message}
@@ -0,0 +1,26 @@
+"""Response renderers for the API"""
+
+import orjson
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+
+# Fallback for types orjson can't serialize natively (e.g. Decimal, pydantic models)
+_fallback_encoder = NinjaJSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """JSON renderer backed by orjson
+
+    Produces the same JSON as ninja's default JSONRenderer for the payloads
+    this API returns, but encodes them in Rust straight to bytes.
+    """
+
+    media_type = "application/json"
+
+    def render(self, request, data, *, response_status):
+        return orjson.dumps(
+            data,
+            default=_fallback_encoder.default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
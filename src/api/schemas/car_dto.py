@@ -1,7 +1,14 @@
+from typing import Optional
+
 from ninja import Schema
+from pydantic import BaseModel
+
+from src.api.schemas.common_dto import MessageResponse
+from src.api.schemas.regional_dto import RegionalResponse
+from src.application.use_cases.car.get_cars import DEFAULT_PAGE_SIZE
 
 
-class CreateCarRequest(Schema):
+class CreateCarRequest(BaseModel):
     """Request schema for creating a car"""
 
     name: str
@@ -14,7 +21,7 @@ class CreateCarRequest(Schema):
     regional: int
 
 
-class UpdateCarRequest(Schema):
+class UpdateCarRequest(BaseModel):
     """Request schema for updating a car (all fields optional)"""
 
     name: str = None
@@ -27,13 +34,6 @@ class UpdateCarRequest(Schema):
     regional: int = None
 
 
-class RegionalResponse(Schema):
-    """Response schema for Regional"""
-
-    id: int
-    name: str
-
-
 class CarResponse(Schema):
     """Response schema for Car"""
 
@@ -61,12 +61,15 @@ class GetCarsFilterRequest(Schema):
     r: int = None  # Regional ID
     s: int = None  # Start date (Unix timestamp)
     e: int = None  # End date (Unix timestamp)
+    limit: int = DEFAULT_PAGE_SIZE  # Page size
+    cursor: int = None  # ID of the last car on the previous page
 
 
 class GetCarsResponse(Schema):
     """Response schema for getting all cars"""
 
     cars: list[CarResponse]
+    next_cursor: Optional[int] = None
 
 
 class UpdateCarResponse(Schema):
@@ -80,9 +83,3 @@ class DeleteCarResponse(Schema):
     """Response schema for deleting a car"""
 
     message: str
-
-
-class MessageResponse(Schema):
-    """Response schema with just a message"""
-
-    message: str
@@ -0,0 +1,7 @@
+from ninja import Schema
+
+
+class MessageResponse(Schema):
+    """Response schema with just a message"""
+
+    message: str
@@ -1,12 +1,15 @@
 from ninja import Schema
-from typing import List
+from pydantic import BaseModel
+from typing import List, Optional
 
+from src.api.schemas.common_dto import MessageResponse
 
-class CreateRegionalRequest(Schema):
+
+class CreateRegionalRequest(BaseModel):
     name: str
 
 
-class UpdateRegionalRequest(Schema):
+class UpdateRegionalRequest(BaseModel):
     name: str
 
 
@@ -33,7 +36,4 @@ class RegionalListResponse(Schema):
     """Response schema for listing regionals"""
 
     regionals: List[RegionalResponse]
-
-
-class MessageResponse(Schema):
-    message: str
+    next_cursor: Optional[int] = None
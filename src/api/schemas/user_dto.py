@@ -1,35 +1,48 @@
+import hmac
+from typing import Any
+
 from ninja import Schema
-from pydantic import model_validator
+from pydantic import BaseModel, model_validator
+
+from src.api.schemas.common_dto import MessageResponse
 
 
-class RegisterRequest(Schema):
+class RegisterRequest(BaseModel):
     """Request schema for user registration with password confirmation validation"""
 
     username: str
     password: str
     confirmPassword: str
 
-    @model_validator(mode="after")
-    def validate_passwords_match(self) -> "RegisterRequest":
-        """Validate that password and confirmPassword match"""
-        if self.password != self.confirmPassword:
-            raise ValueError("Passwords do not match")
-        return self
-
-
-class LoginRequest(Schema):
+    @model_validator(mode="before")
+    @classmethod
+    def validate_passwords_match(cls, data: Any) -> Any:
+        """Validate that password and confirmPassword match
+
+        Runs on the raw payload so mismatches are rejected before any
+        field is materialized. Non-string values are left to field validation.
+        """
+        if isinstance(data, dict):
+            password = data.get("password")
+            confirm_password = data.get("confirmPassword")
+            if (
+                isinstance(password, str)
+                and isinstance(confirm_password, str)
+                and not hmac.compare_digest(
+                    password.encode("utf-8"), confirm_password.encode("utf-8")
+                )
+            ):
+                raise ValueError("Passwords do not match")
+        return data
+
+
+class LoginRequest(BaseModel):
     """Request schema for user login"""
 
     username: str
     password: str
 
 
-class MessageResponse(Schema):
-    """Response schema with message"""
-
-    message: str
-
-
 class LoginResponse(Schema):
     """Response schema for user login"""
 
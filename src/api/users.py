@@ -1,7 +1,15 @@
-from django_ratelimit.decorators import ratelimit
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import HttpResponse
 from ninja import Router
 
 from src.api.dependencies import get_login_use_case, get_register_use_case
+from src.api.ratelimit import async_ratelimit
 from src.application.schemas.result_enums import RegisterErrorCode
 from src.api.schemas.user_dto import (
     LoginRequest,
@@ -13,48 +21,88 @@ from src.api.schemas.user_dto import (
 
 router = Router(tags=["auth"])
 
+# Bounded pool for password hashing, so a burst of logins can't take over
+# the threads other endpoints run on
+AUTH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=getattr(settings, "AUTH_WORKER_THREADS", None) or os.cpu_count(),
+    thread_name_prefix="auth",
+)
+
+# HTTP status for each register failure; anything unlisted maps to 400
+REGISTER_ERROR_STATUS = {
+    RegisterErrorCode.USERNAME_EXISTS: 409,
+}
+
+
+def _json_response(status: int, body: dict) -> HttpResponse:
+    """Serialize a success body directly, bypassing ninja's response pipeline.
+
+    The body already matches the declared response schema, so validating
+    and re-rendering it would be wasted work.
+    """
+    return HttpResponse(
+        orjson.dumps(body),
+        status=status,
+        content_type="application/json; charset=utf-8",
+    )
+
+
+async def _execute_in_worker(use_case, *args):
+    """Run a sync use case on the auth worker pool.
+
+    Password hashing releases the GIL, so concurrent requests hash in
+    parallel. The worker's DB connection is recycled the same way Django
+    does at the end of a sync request.
+    """
+    def run():
+        try:
+            return use_case.execute(*args)
+        finally:
+            close_old_connections()
+
+    return await asyncio.get_running_loop().run_in_executor(AUTH_EXECUTOR, run)
+
 
 @router.post(
     "/register",
     response={201: MessageResponse, 400: MessageResponse, 409: MessageResponse},
 )
-@ratelimit(key="ip", rate="5/m", method="POST")
-def register(request, payload: RegisterRequest):
+@async_ratelimit(key="ip", rate="5/m", method="POST")
+async def register(request, payload: RegisterRequest):
     """Register a new user
 
-    Rate limited to 5 requests per minute per IP address.
+    Rate limited to 5 requests per rolling minute per IP address (sliding
+    window, unlike the fixed-window limits on the regional endpoints).
     Note: Ensure X-Forwarded-For headers are properly configured if behind a proxy.
     """
     # Execute use case directly with the schema
     use_case = get_register_use_case()
-    result = use_case.execute(payload.username, payload.password)
+    result = await _execute_in_worker(use_case, payload.username, payload.password)
 
     # Return response based on error code
     if result.success:
-        return 201, {"message": result.message}
-    elif result.error_code == RegisterErrorCode.USERNAME_EXISTS:
-        return 409, {"message": result.message}
-    else:
-        return 400, {"message": result.message}
+        return _json_response(201, {"message": result.message})
+    return REGISTER_ERROR_STATUS.get(result.error_code, 400), {"message": result.message}
 
 
 @router.post(
     "/login",
     response={200: LoginResponse, 401: MessageResponse},
 )
-@ratelimit(key="ip", rate="10/m", method="POST")
-def login(request, payload: LoginRequest):
+@async_ratelimit(key="ip", rate="10/m", method="POST")
+async def login(request, payload: LoginRequest):
     """Login a user
 
-    Rate limited to 10 requests per minute per IP address to prevent brute-force attacks.
+    Rate limited to 10 requests per rolling minute per IP address to prevent
+    brute-force attacks (sliding window, unlike the regional endpoints).
     Note: Ensure X-Forwarded-For headers are properly configured if behind a proxy.
     """
     # Execute use case directly with the schema
     use_case = get_login_use_case()
-    result = use_case.execute(payload.username, payload.password)
+    result = await _execute_in_worker(use_case, payload.username, payload.password)
 
     # Return response based on result
     if result.success:
-        return 200, {"message": result.message, "token": result.token}
+        return _json_response(200, {"message": result.message, "token": result.token})
     else:
         return 401, {"message": result.message}
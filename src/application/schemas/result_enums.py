@@ -1,9 +1,13 @@
-"""Enums for use case results"""
+"""Enums for use case results
+
+The codes mix in str so equality checks and dict lookups on them use
+str's C-level __eq__/__hash__ instead of Enum's Python-level ones.
+"""
 
 from enum import Enum
 
 
-class RegisterErrorCode(Enum):
+class RegisterErrorCode(str, Enum):
     """Error codes for user registration"""
 
     PASSWORD_MISMATCH = "passwords_do_not_match"
@@ -14,14 +18,14 @@ class RegisterErrorCode(Enum):
     DATABASE_ERROR = "database_error"
 
 
-class LoginErrorCode(Enum):
+class LoginErrorCode(str, Enum):
     """Error codes for user login"""
 
     INVALID_CREDENTIALS = "invalid_credentials"
     INVALID_INPUT = "invalid_input"
 
 
-class RegionalErrorCode(Enum):
+class RegionalErrorCode(str, Enum):
     """Error codes for regional operations"""
 
     INVALID_INPUT = "invalid_input"
@@ -1,6 +1,7 @@
 """Use case for creating a new car."""
 
 from src.domain.entities.car import Car
+from src.domain.exceptions import PlateAlreadyExistsError
 from src.domain.repositories.car_repository import CarRepository
 
 
@@ -47,12 +48,13 @@ class CreateCarUseCase:
 
         Raises:
             DomainValidationError: If car data is invalid
-            ValueError: If plate number already exists or regional doesn't exist
+            PlateAlreadyExistsError: If plate number already exists
+            RegionalNotFoundError: If regional doesn't exist
         """
         # Check plate number uniqueness
         existing_car = self.cars.find_by_plate_number(plate_number)
         if existing_car:
-            raise ValueError(f"Car with plate number {plate_number} already exists")
+            raise PlateAlreadyExistsError(plate_number)
 
         # Create and validate car entity
         car = Car(
@@ -1,5 +1,6 @@
 """Use case for deleting a car."""
 
+from src.domain.exceptions import CarNotFoundError
 from src.domain.repositories.car_repository import CarRepository
 
 
@@ -16,10 +17,10 @@ class DeleteCarUseCase:
             car_id: The car ID to delete
 
         Raises:
-            ValueError: If car not found
+            CarNotFoundError: If car not found
         """
         car = self.cars.find_by_id(car_id)
         if not car:
-            raise ValueError(f"Car with ID {car_id} not found")
+            raise CarNotFoundError(car_id)
 
         self.cars.delete(car)
@@ -1,9 +1,15 @@
 """Use case for retrieving cars."""
 
 from src.domain.entities.car import Car
+from src.domain.exceptions import CarNotFoundError
 from src.domain.repositories.car_repository import CarRepository
 
 
+# Page size bounds for listing cars
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
 class GetCarByIdUseCase:
     """Get a single car by ID."""
 
@@ -20,16 +26,37 @@ class GetCarByIdUseCase:
             The car
 
         Raises:
-            ValueError: If car not found
+            CarNotFoundError: If car not found
         """
         car = self.cars.find_by_id(car_id)
         if not car:
-            raise ValueError(f"Car with ID {car_id} not found")
+            raise CarNotFoundError(car_id)
+        return car
+
+    async def aexecute(self, car_id: int) -> Car:
+        """Asynchronously get a car by ID.
+
+        Args:
+            car_id: The car ID
+
+        Returns:
+            The car
+
+        Raises:
+            CarNotFoundError: If car not found
+        """
+        car = await self.cars.afind_by_id(car_id)
+        if not car:
+            raise CarNotFoundError(car_id)
         return car
 
 
 class GetCarsUseCase:
-    """Get all cars, optionally filtered by region and date range."""
+    """Get cars page by page, optionally filtered by region and date range.
+
+    Pagination is keyset-based on car ID: pass the last ID of the previous
+    page as ``cursor`` to get the next page.
+    """
 
     def __init__(self, cars: CarRepository):
         self.cars = cars
@@ -39,6 +66,8 @@ class GetCarsUseCase:
         regional_id: int = None,
         start_date: int = None,
         end_date: int = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: int = None,
     ) -> list[Car]:
         """Get cars with optional filtering.
 
@@ -46,14 +75,75 @@ class GetCarsUseCase:
             regional_id: Filter by regional ID (optional)
             start_date: Start date as Unix timestamp (optional, must be provided with regional_id and end_date)
             end_date: End date as Unix timestamp (optional, must be provided with regional_id and start_date)
+            limit: Maximum number of cars to return (1 to MAX_PAGE_SIZE)
+            cursor: Only return cars with an ID greater than this (optional)
 
         Returns:
-            List of cars
+            List of cars ordered by ID
+
+        Raises:
+            ValueError: If filter or pagination parameters are invalid
+        """
+        self._validate_page(limit)
+
+        # Get all cars if no filter
+        if not self._validate_filters(regional_id, start_date, end_date):
+            return self.cars.find_all(limit=limit, cursor=cursor)
+
+        # Get cars by regional (in a real system, we'd also filter by availability in date range)
+        return self.cars.find_by_regional_id(regional_id, limit=limit, cursor=cursor)
+
+    async def aexecute(
+        self,
+        regional_id: int = None,
+        start_date: int = None,
+        end_date: int = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: int = None,
+    ) -> list[Car]:
+        """Asynchronously get cars with optional filtering.
+
+        Accepts the same arguments as ``execute``.
+
+        Returns:
+            List of cars ordered by ID
+
+        Raises:
+            ValueError: If filter or pagination parameters are invalid
+        """
+        self._validate_page(limit)
+
+        if not self._validate_filters(regional_id, start_date, end_date):
+            return await self.cars.afind_all(limit=limit, cursor=cursor)
+
+        return await self.cars.afind_by_regional_id(
+            regional_id, limit=limit, cursor=cursor
+        )
+
+    @staticmethod
+    def _validate_page(limit: int) -> None:
+        """Validate the page size.
+
+        Raises:
+            ValueError: If limit is out of range
+        """
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            raise ValueError(f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+
+    @staticmethod
+    def _validate_filters(
+        regional_id: int = None,
+        start_date: int = None,
+        end_date: int = None,
+    ) -> bool:
+        """Validate filter parameters.
+
+        Returns:
+            True if filters were provided, False if none were
 
         Raises:
             ValueError: If filter parameters are invalid
         """
-        # Validate filter parameters
         has_regional = regional_id is not None
         has_start = start_date is not None
         has_end = end_date is not None
@@ -68,9 +158,4 @@ class GetCarsUseCase:
         if has_start and has_end and end_date < start_date:
             raise ValueError("End date must be greater than or equal to start date")
 
-        # Get all cars if no filter
-        if not has_regional:
-            return self.cars.find_all()
-
-        # Get cars by regional (in a real system, we'd also filter by availability in date range)
-        return self.cars.find_by_regional_id(regional_id)
+        return has_regional
@@ -1,6 +1,7 @@
 """Use case for updating a car."""
 
 from src.domain.entities.car import Car
+from src.domain.exceptions import CarNotFoundError, PlateAlreadyExistsError
 from src.domain.repositories.car_repository import CarRepository
 
 
@@ -26,13 +27,15 @@ class UpdateCarUseCase:
             The updated car
 
         Raises:
-            ValueError: If car not found, regional doesn't exist, or plate number already exists
+            CarNotFoundError: If car not found
+            RegionalNotFoundError: If regional doesn't exist
+            PlateAlreadyExistsError: If plate number already exists
             DomainValidationError: If updated data is invalid
         """
         # Get existing car
         car = self.cars.find_by_id(car_id)
         if not car:
-            raise ValueError(f"Car with ID {car_id} not found")
+            raise CarNotFoundError(car_id)
 
         # If plate number is being updated, check uniqueness
         if (
@@ -41,9 +44,7 @@ class UpdateCarUseCase:
         ):
             existing_car = self.cars.find_by_plate_number(update_fields["plate_number"])
             if existing_car:
-                raise ValueError(
-                    f"Car with plate number {update_fields['plate_number']} already exists"
-                )
+                raise PlateAlreadyExistsError(update_fields["plate_number"])
 
         # Update car with validation
         car.update(**update_fields)
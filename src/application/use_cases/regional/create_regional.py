@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from django.db import DatabaseError, IntegrityError, transaction
+from django.db import DatabaseError
 
 from src.application.schemas.result_enums import RegionalErrorCode
 from src.domain.entities.regional import Regional
@@ -9,7 +9,7 @@ from src.domain.exceptions import InvalidRegionalNameError
 from src.domain.repositories.regional_repository import RegionalRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateRegionalResult:
     """Result of the create regional use case"""
 
@@ -44,17 +44,10 @@ class CreateRegionalUseCase:
                 error_code=RegionalErrorCode.INVALID_INPUT,
             )
 
-        # Save regional with transaction to ensure atomicity
+        # Single INSERT that skips taken names, so a duplicate is reported
+        # without raising and catching an IntegrityError
         try:
-            with transaction.atomic():
-                saved_regional = self.regionals.save(regional)
-        except IntegrityError:
-            # Handle duplicate name error
-            return CreateRegionalResult(
-                success=False,
-                message="Regional with this name already exists",
-                error_code=RegionalErrorCode.ALREADY_EXISTS,
-            )
+            saved_regional = self.regionals.insert_if_absent(regional)
         except DatabaseError:
             # Handle database connection or constraint errors
             return CreateRegionalResult(
@@ -63,6 +56,13 @@ class CreateRegionalUseCase:
                 error_code=RegionalErrorCode.DATABASE_ERROR,
             )
 
+        if saved_regional is None:
+            return CreateRegionalResult(
+                success=False,
+                message="Regional with this name already exists",
+                error_code=RegionalErrorCode.ALREADY_EXISTS,
+            )
+
         return CreateRegionalResult(
             success=True,
             message="Regional created successfully",
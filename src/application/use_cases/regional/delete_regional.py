@@ -1,13 +1,13 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from django.db import DatabaseError, transaction
+from django.db import DatabaseError
 
 from src.application.schemas.result_enums import RegionalErrorCode
 from src.domain.repositories.regional_repository import RegionalRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteRegionalResult:
     """Result of the delete regional use case"""
 
@@ -38,19 +38,10 @@ class DeleteRegionalUseCase:
                 error_code=RegionalErrorCode.INVALID_INPUT,
             )
 
-        # Find existing regional
-        existing_regional = self.regionals.find_by_id(regional_id)
-        if existing_regional is None:
-            return DeleteRegionalResult(
-                success=False,
-                message="Regional not found",
-                error_code=RegionalErrorCode.NOT_FOUND,
-            )
-
-        # Delete regional with transaction
+        # Delete regional; the ORM runs the cascade in its own transaction.
+        # No rows deleted means it didn't exist
         try:
-            with transaction.atomic():
-                self.regionals.delete(existing_regional)
+            deleted = self.regionals.delete_by_id(regional_id)
         except DatabaseError:
             return DeleteRegionalResult(
                 success=False,
@@ -58,6 +49,13 @@ class DeleteRegionalUseCase:
                 error_code=RegionalErrorCode.DATABASE_ERROR,
             )
 
+        if deleted == 0:
+            return DeleteRegionalResult(
+                success=False,
+                message="Regional not found",
+                error_code=RegionalErrorCode.NOT_FOUND,
+            )
+
         return DeleteRegionalResult(
             success=True,
             message="Regional deleted successfully",
@@ -6,7 +6,7 @@ from src.domain.entities.regional import Regional
 from src.domain.repositories.regional_repository import RegionalRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class GetRegionalResult:
     """Result of the get regional by ID use case"""
 
@@ -1,34 +1,58 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
+from src.application.schemas.result_enums import RegionalErrorCode
 from src.domain.entities.regional import Regional
 from src.domain.repositories.regional_repository import RegionalRepository
 
 
-@dataclass
+# Page size bounds for listing regionals
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 100
+
+
+@dataclass(slots=True)
 class GetRegionalsResult:
     """Result of the get all regionals use case"""
 
     success: bool
     message: str
     regionals: List[Regional]
+    next_cursor: Optional[int] = None
+    error_code: Optional[RegionalErrorCode] = None
 
 
 class GetRegionalsUseCase:
     def __init__(self, regionals: RegionalRepository):
         self.regionals = regionals
 
-    def execute(self) -> GetRegionalsResult:
+    def execute(
+        self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[int] = None
+    ) -> GetRegionalsResult:
         """
-        Get all regionals.
+        Get a page of regionals, ordered by ID.
+
+        Args:
+            limit: Maximum number of regionals to return
+            cursor: Only return regionals with an ID greater than this
 
         Returns:
-            GetRegionalsResult: Result containing list of all regionals
+            GetRegionalsResult: Result containing the page of regionals and the
+            cursor for the next page (None on the last page)
         """
-        regionals = self.regionals.find_all()
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            return GetRegionalsResult(
+                success=False,
+                message=f"Limit must be between 1 and {MAX_PAGE_SIZE}",
+                regionals=[],
+                error_code=RegionalErrorCode.INVALID_INPUT,
+            )
+
+        regionals = self.regionals.find_all(limit=limit, cursor=cursor)
 
         return GetRegionalsResult(
             success=True,
             message="Regionals retrieved successfully",
             regionals=regionals,
+            next_cursor=regionals[-1].id if len(regionals) == limit else None,
         )
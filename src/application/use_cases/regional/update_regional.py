@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from django.db import DatabaseError, transaction
+from django.db import DatabaseError
 
 from src.application.schemas.result_enums import RegionalErrorCode
 from src.domain.entities.regional import Regional
@@ -9,7 +9,7 @@ from src.domain.exceptions import InvalidRegionalNameError
 from src.domain.repositories.regional_repository import RegionalRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateRegionalResult:
     """Result of the update regional use case"""
 
@@ -42,19 +42,10 @@ class UpdateRegionalUseCase:
                 error_code=RegionalErrorCode.INVALID_INPUT,
             )
 
-        # Find existing regional
-        existing_regional = self.regionals.find_by_id(regional_id)
-        if existing_regional is None:
-            return UpdateRegionalResult(
-                success=False,
-                message="Regional not found",
-                error_code=RegionalErrorCode.NOT_FOUND,
-            )
-
         # Validate new name by creating a temporary Regional entity
         # Validation happens automatically in __post_init__
         try:
-            validated_regional = Regional(name=name, id=existing_regional.id)
+            validated_regional = Regional(name=name, id=regional_id)
         except InvalidRegionalNameError as e:
             return UpdateRegionalResult(
                 success=False,
@@ -62,10 +53,11 @@ class UpdateRegionalUseCase:
                 error_code=RegionalErrorCode.INVALID_INPUT,
             )
 
-        # Save updated regional with transaction
+        # Single UPDATE; no matching row means the regional doesn't exist
         try:
-            with transaction.atomic():
-                updated_regional = self.regionals.update(validated_regional)
+            updated_regional = self.regionals.update_and_return(
+                validated_regional.id, validated_regional.name
+            )
         except DatabaseError:
             return UpdateRegionalResult(
                 success=False,
@@ -73,6 +65,13 @@ class UpdateRegionalUseCase:
                 error_code=RegionalErrorCode.DATABASE_ERROR,
             )
 
+        if updated_regional is None:
+            return UpdateRegionalResult(
+                success=False,
+                message="Regional not found",
+                error_code=RegionalErrorCode.NOT_FOUND,
+            )
+
         return UpdateRegionalResult(
             success=True,
             message="Regional updated successfully",
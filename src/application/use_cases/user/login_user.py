@@ -1,17 +1,58 @@
 import jwt
+import logging
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
 from django.conf import settings
+from django.db import DatabaseError
 
 from src.application.schemas.result_enums import LoginErrorCode
-from src.application.utils.password_utils import verify_password
-from src.domain.entities.user import User
+from src.application.utils.password_utils import (
+    hash_password,
+    needs_rehash,
+    verify_password,
+)
+from src.domain.entities.user import User, normalize_username
 from src.domain.repositories.user_repository import UserRepository
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# JWT configuration. SECRET_KEY is read per token so importing this module
+# doesn't require it and override_settings applies
+JWT_EXPIRATION_SECONDS = getattr(settings, "JWT_EXPIRATION_HOURS", 24) * 3600
+JWT_ALGORITHM = getattr(settings, "JWT_ALGORITHM", "HS256")
+
+# Logins of the same user within one bucket reuse the same signed token
+TOKEN_BUCKET_SECONDS = 15
+
+
+@lru_cache(maxsize=None)
+def _dummy_password_hash() -> str:
+    """Hash to verify against on unknown usernames, built on first use
+
+    Keeps both login failure paths at one hash each without paying for an
+    argon2 hash on every import of this module.
+    """
+    return hash_password("dummy-password-for-timing")
+
+
+@lru_cache(maxsize=4096)
+def _sign_token(user_id: int, username: str, bucket: int, secret_key: str) -> str:
+    """Sign a JWT whose timestamps depend only on the time bucket"""
+    issued_at = bucket * TOKEN_BUCKET_SECONDS
+    payload = {
+        "user_id": user_id,
+        "username": username,
+        "exp": issued_at + JWT_EXPIRATION_SECONDS,
+        "iat": issued_at,  # Issued at (start of the bucket)
+    }
+    return jwt.encode(payload, secret_key, algorithm=JWT_ALGORITHM)
+
+
+@dataclass(slots=True)
 class LoginUserResult:
     """Result of the login user use case"""
 
@@ -46,11 +87,13 @@ class LoginUserUseCase:
             )
 
         # Normalize username to lowercase for case-insensitive login
-        normalized_username = username.strip().lower()
+        normalized_username = normalize_username(username)
 
         # Check if username exists
         existing_user = self.users.find_by_username(normalized_username)
         if existing_user is None:
+            # Spend the same hashing time as a wrong password to hide which usernames exist
+            verify_password(password, _dummy_password_hash())
             return LoginUserResult(
                 success=False,
                 message="Invalid credentials",
@@ -65,6 +108,10 @@ class LoginUserUseCase:
                 error_code=LoginErrorCode.INVALID_CREDENTIALS,
             )
 
+        # Upgrade legacy or outdated hashes while the plain password is at hand
+        if needs_rehash(existing_user.password):
+            self._rehash_password(existing_user, password)
+
         # Generate JWT token
         token = self._generate_token(existing_user)
 
@@ -72,19 +119,18 @@ class LoginUserUseCase:
             success=True, message="User logged in successfully", token=token
         )
 
+    def _rehash_password(self, user: User, password: str) -> None:
+        """Store a fresh hash for the user, without failing the login"""
+        try:
+            self.users.update_password(user.id, hash_password(password))
+        except DatabaseError as e:
+            logger.error(f"Database error in _rehash_password: {e}")
+
     def _generate_token(self, user: User) -> str:
-        """Generate a JWT token for the user"""
-        now = datetime.now(timezone.utc)
-
-        # Get JWT configuration from settings
-        expiration_hours = getattr(settings, "JWT_EXPIRATION_HOURS", 24)
-        algorithm = getattr(settings, "JWT_ALGORITHM", "HS256")
-
-        payload = {
-            "user_id": user.id,
-            "username": user.username,
-            "exp": now + timedelta(hours=expiration_hours),
-            "iat": now,  # Issued at
-        }
-        token = jwt.encode(payload, settings.SECRET_KEY, algorithm=algorithm)
-        return token
+        """Generate a JWT token for the user
+
+        Tokens are cached per user for TOKEN_BUCKET_SECONDS, so repeated
+        logins within that window skip re-signing.
+        """
+        bucket = int(time.time()) // TOKEN_BUCKET_SECONDS
+        return _sign_token(user.id, user.username, bucket, settings.SECRET_KEY)
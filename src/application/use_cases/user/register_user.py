@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from django.db import DatabaseError, IntegrityError, transaction
+from django.db import DatabaseError
 
 from src.application.schemas.result_enums import RegisterErrorCode
 from src.application.utils.password_utils import hash_password
@@ -10,7 +10,7 @@ from src.domain.exceptions import InvalidPasswordError, InvalidUsernameError
 from src.domain.repositories.user_repository import UserRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class RegisterUserResult:
     """Result of the register user use case"""
 
@@ -70,8 +70,7 @@ class RegisterUserUseCase:
             )
 
         # Check if username already exists (case-insensitive - username is already normalized)
-        existing_user = self.users.find_by_username(user.username)
-        if existing_user is not None:
+        if self.users.username_exists(user.username):
             return RegisterUserResult(
                 success=False,
                 message="Username already exists",
@@ -84,17 +83,10 @@ class RegisterUserUseCase:
             username=user.username, password=hashed_password, is_hashed=True
         )
 
-        # Save user with transaction to ensure atomicity
+        # Single INSERT that skips taken usernames, covering the race where the
+        # username was created between the check above and this insert
         try:
-            with transaction.atomic():
-                saved_user = self.users.save(user_to_save)
-        except IntegrityError:
-            # Handle race condition where username was created between check and save
-            return RegisterUserResult(
-                success=False,
-                message="Username already exists",
-                error_code=RegisterErrorCode.USERNAME_EXISTS,
-            )
+            saved_user = self.users.insert_if_absent(user_to_save)
         except DatabaseError:
             # Handle database connection or constraint errors
             return RegisterUserResult(
@@ -103,6 +95,13 @@ class RegisterUserUseCase:
                 error_code=RegisterErrorCode.DATABASE_ERROR,
             )
 
+        if saved_user is None:
+            return RegisterUserResult(
+                success=False,
+                message="Username already exists",
+                error_code=RegisterErrorCode.USERNAME_EXISTS,
+            )
+
         return RegisterUserResult(
             success=True, message="User registered successfully", user=saved_user
         )
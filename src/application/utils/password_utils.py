@@ -1,10 +1,28 @@
 """Utility functions for password hashing and verification"""
+from functools import lru_cache
+
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from django.conf import settings
+
+# Prefix shared by all argon2 PHC hash strings
+ARGON2_PREFIX = "$argon2"
+
+
+@lru_cache()
+def _get_hasher() -> PasswordHasher:
+    """Build the argon2id hasher from settings once per process"""
+    return PasswordHasher(
+        time_cost=getattr(settings, "PASSWORD_HASH_ROUNDS", 2),
+        memory_cost=getattr(settings, "PASSWORD_HASH_MEMORY_KIB", 19456),
+        parallelism=1,
+    )
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt with salt.
+    Hash a password using argon2id with salt.
     
     Args:
         password: Plain text password to hash
@@ -12,14 +30,14 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+    return _get_hasher().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash using constant-time comparison.
+
+    Accepts both argon2id hashes and legacy bcrypt hashes.
     
     Args:
         plain_password: Plain text password to verify
@@ -28,6 +46,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    if hashed_password.startswith(ARGON2_PREFIX):
+        try:
+            return _get_hasher().verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
     try:
         return bcrypt.checkpw(
             plain_password.encode('utf-8'),
@@ -36,3 +60,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     except Exception:
         # If verification fails for any reason, return False
         return False
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced with a fresh one.
+
+    True for legacy bcrypt hashes and for argon2 hashes created with
+    parameters different from the current settings.
+
+    Args:
+        hashed_password: Hashed password as stored
+
+    Returns:
+        True if the password should be rehashed, False otherwise
+    """
+    if not hashed_password.startswith(ARGON2_PREFIX):
+        return True
+    try:
+        return _get_hasher().check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
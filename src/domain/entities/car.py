@@ -1,9 +1,21 @@
 """Car domain entity with built-in validation."""
 
 from dataclasses import dataclass
-from typing import Optional
-
-from src.domain.exceptions import DomainValidationError
+from typing import AbstractSet, Optional
+
+from src.domain.entities.regional import Regional
+from src.domain.exceptions import (
+    INVALID_BRAND,
+    INVALID_CAR_NAME,
+    INVALID_COLOR,
+    INVALID_FIELD,
+    INVALID_MODEL,
+    INVALID_PLATE_NUMBER,
+    INVALID_PRICE,
+    INVALID_REGIONAL_ID,
+    INVALID_YEAR,
+    DomainValidationError,
+)
 
 
 # Validation constants
@@ -14,8 +26,34 @@ YEAR_MIN, YEAR_MAX = 1900, 2027
 PLATE_NUMBER_MIN, PLATE_NUMBER_MAX = 3, 20
 COLOR_MIN, COLOR_MAX = 2, 30
 
-
-@dataclass
+# Validation error messages, formatted once at import
+NAME_ERROR = f"Name must be between {CAR_NAME_MIN} and {CAR_NAME_MAX} characters"
+BRAND_ERROR = f"Brand must be between {BRAND_MIN} and {BRAND_MAX} characters"
+MODEL_ERROR = f"Model must be between {MODEL_MIN} and {MODEL_MAX} characters"
+YEAR_ERROR = f"Year must be between {YEAR_MIN} and {YEAR_MAX}"
+PLATE_NUMBER_ERROR = (
+    f"Plate number must be between {PLATE_NUMBER_MIN} and {PLATE_NUMBER_MAX} characters"
+)
+COLOR_ERROR = f"Color must be between {COLOR_MIN} and {COLOR_MAX} characters"
+PRICE_ERROR = "Price per day must be a non-negative number"
+REGIONAL_ID_ERROR = "Regional ID must be a positive integer"
+
+# Fields that can be validated and updated
+CAR_FIELDS = frozenset(
+    {
+        "name",
+        "brand",
+        "model",
+        "year",
+        "plate_number",
+        "color",
+        "price_per_day",
+        "regional_id",
+    }
+)
+
+
+@dataclass(slots=True)
 class Car:
     """
     Car domain entity.
@@ -33,6 +71,7 @@ class Car:
         price_per_day: Daily rental price
         regional_id: Regional/location ID where car is available
         id: Unique identifier (set by repository on save)
+        regional: Regional the car belongs to (loaded by the repository)
     """
 
     name: str
@@ -44,126 +83,81 @@ class Car:
     price_per_day: float
     regional_id: int
     id: Optional[int] = None
+    regional: Optional[Regional] = None
 
     def __post_init__(self):
         """Validate car data after initialization."""
-        self._validate_all()
-
-    def _validate_all(self) -> None:
-        """Validate all car fields."""
-        self._validate_name()
-        self._validate_brand()
-        self._validate_model()
-        self._validate_year()
-        self._validate_plate_number()
-        self._validate_color()
-        self._validate_price_per_day()
-        self._validate_regional_id()
-
-    def _validate_name(self) -> None:
-        """Validate name format.
-
-        Raises:
-            DomainValidationError: If name is invalid
-        """
-        if (
-            not self.name
-            or len(self.name) < CAR_NAME_MIN
-            or len(self.name) > CAR_NAME_MAX
-        ):
-            raise DomainValidationError(
-                f"Name must be between {CAR_NAME_MIN} and {CAR_NAME_MAX} characters",
-                "INVALID_CAR_NAME",
-            )
-
-    def _validate_brand(self) -> None:
-        """Validate brand format.
-
-        Raises:
-            DomainValidationError: If brand is invalid
-        """
-        if not self.brand or len(self.brand) < BRAND_MIN or len(self.brand) > BRAND_MAX:
-            raise DomainValidationError(
-                f"Brand must be between {BRAND_MIN} and {BRAND_MAX} characters",
-                "INVALID_BRAND",
-            )
-
-    def _validate_model(self) -> None:
-        """Validate model format.
-
-        Raises:
-            DomainValidationError: If model is invalid
-        """
-        if not self.model or len(self.model) < MODEL_MIN or len(self.model) > MODEL_MAX:
-            raise DomainValidationError(
-                f"Model must be between {MODEL_MIN} and {MODEL_MAX} characters",
-                "INVALID_MODEL",
-            )
-
-    def _validate_year(self) -> None:
-        """Validate year format.
+        self._validate()
 
-        Raises:
-            DomainValidationError: If year is invalid
-        """
-        if (
-            not isinstance(self.year, int)
-            or self.year < YEAR_MIN
-            or self.year > YEAR_MAX
-        ):
-            raise DomainValidationError(
-                f"Year must be between {YEAR_MIN} and {YEAR_MAX}", "INVALID_YEAR"
-            )
-
-    def _validate_plate_number(self) -> None:
-        """Validate plate number format.
+    @classmethod
+    def trusted(cls, **fields) -> "Car":
+        """Build a car from already validated data, skipping validation.
 
-        Raises:
-            DomainValidationError: If plate number is invalid
+        Like pydantic's model_construct: meant for repositories loading rows
+        that were validated when written. Use Car(...) for any other input.
         """
-        if (
-            not self.plate_number
-            or len(self.plate_number) < PLATE_NUMBER_MIN
-            or len(self.plate_number) > PLATE_NUMBER_MAX
-        ):
-            raise DomainValidationError(
-                f"Plate number must be between {PLATE_NUMBER_MIN} and {PLATE_NUMBER_MAX} characters",
-                "INVALID_PLATE_NUMBER",
-            )
-
-    def _validate_color(self) -> None:
-        """Validate color format.
+        car = object.__new__(cls)
+        car.id = None
+        car.regional = None
+        for field_name, value in fields.items():
+            setattr(car, field_name, value)
+        return car
 
-        Raises:
-            DomainValidationError: If color is invalid
-        """
-        if not self.color or len(self.color) < COLOR_MIN or len(self.color) > COLOR_MAX:
-            raise DomainValidationError(
-                f"Color must be between {COLOR_MIN} and {COLOR_MAX} characters",
-                "INVALID_COLOR",
-            )
+    def _validate(self, fields: AbstractSet[str] = CAR_FIELDS) -> None:
+        """Validate car fields in field order.
 
-    def _validate_price_per_day(self) -> None:
-        """Validate price per day.
+        Checks are inlined so building a car costs a single method call;
+        error messages are module constants formatted once at import.
 
-        Raises:
-            DomainValidationError: If price is invalid
-        """
-        if not isinstance(self.price_per_day, (int, float)) or self.price_per_day < 0:
-            raise DomainValidationError(
-                "Price per day must be a non-negative number", "INVALID_PRICE"
-            )
-
-    def _validate_regional_id(self) -> None:
-        """Validate regional ID.
+        Args:
+            fields: Names of the fields to check (defaults to all of them)
 
         Raises:
-            DomainValidationError: If regional_id is invalid
+            DomainValidationError: If any field is invalid
         """
-        if not isinstance(self.regional_id, int) or self.regional_id <= 0:
-            raise DomainValidationError(
-                "Regional ID must be a positive integer", "INVALID_REGIONAL_ID"
-            )
+        if "name" in fields:
+            name = self.name
+            if not name or len(name) < CAR_NAME_MIN or len(name) > CAR_NAME_MAX:
+                raise DomainValidationError(NAME_ERROR, INVALID_CAR_NAME)
+
+        if "brand" in fields:
+            brand = self.brand
+            if not brand or len(brand) < BRAND_MIN or len(brand) > BRAND_MAX:
+                raise DomainValidationError(BRAND_ERROR, INVALID_BRAND)
+
+        if "model" in fields:
+            model = self.model
+            if not model or len(model) < MODEL_MIN or len(model) > MODEL_MAX:
+                raise DomainValidationError(MODEL_ERROR, INVALID_MODEL)
+
+        if "year" in fields:
+            year = self.year
+            if type(year) is not int or year < YEAR_MIN or year > YEAR_MAX:
+                raise DomainValidationError(YEAR_ERROR, INVALID_YEAR)
+
+        if "plate_number" in fields:
+            plate_number = self.plate_number
+            if (
+                not plate_number
+                or len(plate_number) < PLATE_NUMBER_MIN
+                or len(plate_number) > PLATE_NUMBER_MAX
+            ):
+                raise DomainValidationError(PLATE_NUMBER_ERROR, INVALID_PLATE_NUMBER)
+
+        if "color" in fields:
+            color = self.color
+            if not color or len(color) < COLOR_MIN or len(color) > COLOR_MAX:
+                raise DomainValidationError(COLOR_ERROR, INVALID_COLOR)
+
+        if "price_per_day" in fields:
+            price_per_day = self.price_per_day
+            if type(price_per_day) not in (int, float) or price_per_day < 0:
+                raise DomainValidationError(PRICE_ERROR, INVALID_PRICE)
+
+        if "regional_id" in fields:
+            regional_id = self.regional_id
+            if type(regional_id) is not int or regional_id <= 0:
+                raise DomainValidationError(REGIONAL_ID_ERROR, INVALID_REGIONAL_ID)
 
     def update(self, **kwargs) -> None:
         """Update car fields with validation.
@@ -176,22 +170,20 @@ class Car:
         Raises:
             DomainValidationError: If any updated field is invalid
         """
-        allowed_fields = {
-            "name",
-            "brand",
-            "model",
-            "year",
-            "plate_number",
-            "color",
-            "price_per_day",
-            "regional_id",
-        }
         for key, value in kwargs.items():
-            if key not in allowed_fields:
-                raise DomainValidationError(
-                    f"Cannot update field '{key}'", "INVALID_FIELD"
-                )
-            setattr(self, key, value)
-
-        # Re-validate all fields after update
-        self._validate_all()
+            setter = CAR_FIELD_SETTERS.get(key)
+            if setter is None:
+                raise DomainValidationError(f"Cannot update field '{key}'", INVALID_FIELD)
+            setter(self, value)
+
+        # Drop the loaded regional if it no longer matches regional_id
+        if self.regional is not None and self.regional.id != self.regional_id:
+            self.regional = None
+
+        # Only the updated fields can have become invalid
+        self._validate(kwargs.keys())
+
+
+# Slot descriptor setters for the updatable fields, so Car.update assigns
+# through them directly instead of going through setattr
+CAR_FIELD_SETTERS = {name: getattr(Car, name).__set__ for name in CAR_FIELDS}
@@ -6,7 +6,7 @@ from typing import Optional
 from src.domain.exceptions import InvalidRegionalNameError
 
 
-@dataclass
+@dataclass(slots=True)
 class Regional:
     """
     Regional domain entity.
@@ -30,6 +30,18 @@ class Regional:
         # Validate name
         self._validate_name()
 
+    @classmethod
+    def trusted(cls, name: str, id: Optional[int] = None) -> "Regional":
+        """Build a regional from already validated data, skipping validation.
+
+        Meant for repositories loading stored rows; use Regional(...) for
+        any other input.
+        """
+        regional = object.__new__(cls)
+        regional.name = name
+        regional.id = id
+        return regional
+
     def _validate_name(self) -> None:
         """
         Validate regional name: required, 2-50 characters.
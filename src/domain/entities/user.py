@@ -1,16 +1,26 @@
 """User domain entity with built-in validation."""
 
-import re
+import string
 from dataclasses import dataclass, field
 from typing import Optional
 
 from src.domain.exceptions import InvalidPasswordError, InvalidUsernameError
 
-# Password validation pattern - special characters for password strength
-PASSWORD_SPECIAL_CHARS_PATTERN = r'[!@#$%^&*(),.?":{}|<>_=+/\\;:\[\]~`-]'
+# Password validation - special characters for password strength
+PASSWORD_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>_=+/\\;[]~`-')
 
+# Username validation - allowed characters (ASCII letters, digits, underscore)
+USERNAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
 
-@dataclass
+
+def normalize_username(username: str) -> str:
+    """Strip and lowercase a username, skipping the copies when already normalized."""
+    if username.islower() and not (username[:1].isspace() or username[-1:].isspace()):
+        return username
+    return username.strip().lower()
+
+
+@dataclass(slots=True)
 class User:
     """
     User domain entity.
@@ -32,7 +42,7 @@ class User:
     def __post_init__(self):
         """Validate user data after initialization."""
         # Normalize username
-        self.username = self.username.strip().lower()
+        self.username = normalize_username(self.username)
 
         # Always validate username format
         self._validate_username()
@@ -50,7 +60,7 @@ class User:
         """
         if len(self.username) < 3 or len(self.username) > 32:
             raise InvalidUsernameError()
-        if not re.match(r"^[a-zA-Z0-9_]+$", self.username):
+        if not USERNAME_CHARS.issuperset(self.username):
             raise InvalidUsernameError()
 
     def _validate_password(self) -> None:
@@ -63,11 +73,20 @@ class User:
         """
         if len(self.password) < 8 or len(self.password) > 128:
             raise InvalidPasswordError()
-        has_upper = re.search(r"[A-Z]", self.password) is not None
-        has_lower = re.search(r"[a-z]", self.password) is not None
-        has_digit = re.search(r"\d", self.password) is not None
-        has_special = (
-            re.search(PASSWORD_SPECIAL_CHARS_PATTERN, self.password) is not None
-        )
+        # Classify each character in a single pass, stopping once all are seen
+        has_upper = has_lower = has_digit = has_special = False
+        for ch in self.password:
+            if "A" <= ch <= "Z":
+                has_upper = True
+            elif "a" <= ch <= "z":
+                has_lower = True
+            elif ch.isdecimal():
+                has_digit = True
+            elif ch in PASSWORD_SPECIAL_CHARS:
+                has_special = True
+            else:
+                continue
+            if has_upper and has_lower and has_digit and has_special:
+                break
         if not (has_upper and has_lower and has_digit and has_special):
             raise InvalidPasswordError()
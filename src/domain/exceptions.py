@@ -1,5 +1,23 @@
 """Domain exceptions for validation errors."""
 
+# Error codes carried by DomainValidationError.code. Shared constants keep
+# every raise site on the same (interned literal) string object.
+INVALID_CAR_NAME = "INVALID_CAR_NAME"
+INVALID_BRAND = "INVALID_BRAND"
+INVALID_MODEL = "INVALID_MODEL"
+INVALID_YEAR = "INVALID_YEAR"
+INVALID_PLATE_NUMBER = "INVALID_PLATE_NUMBER"
+INVALID_COLOR = "INVALID_COLOR"
+INVALID_PRICE = "INVALID_PRICE"
+INVALID_REGIONAL_ID = "INVALID_REGIONAL_ID"
+INVALID_FIELD = "INVALID_FIELD"
+INVALID_USERNAME = "INVALID_USERNAME"
+INVALID_PASSWORD = "INVALID_PASSWORD"
+INVALID_REGIONAL_NAME = "INVALID_REGIONAL_NAME"
+CAR_NOT_FOUND = "CAR_NOT_FOUND"
+PLATE_ALREADY_EXISTS = "PLATE_ALREADY_EXISTS"
+REGIONAL_NOT_FOUND = "REGIONAL_NOT_FOUND"
+
 
 class DomainValidationError(ValueError):
     """Base exception for domain validation errors"""
@@ -17,7 +35,7 @@ class InvalidUsernameError(DomainValidationError):
         self,
         message: str = "Username must be 3-32 characters and contain only letters, numbers, and underscores.",
     ):
-        super().__init__(message, "INVALID_USERNAME")
+        super().__init__(message, INVALID_USERNAME)
 
 
 class InvalidPasswordError(DomainValidationError):
@@ -31,7 +49,7 @@ class InvalidPasswordError(DomainValidationError):
             "special character."
         ),
     ):
-        super().__init__(message, "INVALID_PASSWORD")
+        super().__init__(message, INVALID_PASSWORD)
 
 
 class InvalidRegionalNameError(DomainValidationError):
@@ -41,4 +59,30 @@ class InvalidRegionalNameError(DomainValidationError):
         self,
         message: str = "Regional name must be between 2 and 50 characters.",
     ):
-        super().__init__(message, "INVALID_REGIONAL_NAME")
+        super().__init__(message, INVALID_REGIONAL_NAME)
+
+
+class CarNotFoundError(DomainValidationError):
+    """Raised when a car does not exist"""
+
+    def __init__(self, car_id: int):
+        super().__init__(f"Car with ID {car_id} not found", CAR_NOT_FOUND)
+
+
+class PlateAlreadyExistsError(DomainValidationError):
+    """Raised when a car with the same plate number already exists"""
+
+    def __init__(self, plate_number: str):
+        super().__init__(
+            f"Car with plate number {plate_number} already exists",
+            PLATE_ALREADY_EXISTS,
+        )
+
+
+class RegionalNotFoundError(DomainValidationError):
+    """Raised when a referenced regional does not exist"""
+
+    def __init__(self, regional_id: int):
+        super().__init__(
+            f"Regional with ID {regional_id} not found", REGIONAL_NOT_FOUND
+        )
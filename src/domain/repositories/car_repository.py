@@ -16,13 +16,42 @@ class CarRepository(ABC):
         pass
 
     @abstractmethod
-    def find_all(self) -> list[Car]:
-        """Find all cars in the repository"""
+    def find_all(
+        self, limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> list[Car]:
+        """Find cars ordered by id, after the cursor id and up to limit if given"""
         pass
 
     @abstractmethod
-    def find_by_regional_id(self, regional_id: int) -> list[Car]:
-        """Find all cars in a specific regional"""
+    def find_by_regional_id(
+        self,
+        regional_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[int] = None,
+    ) -> list[Car]:
+        """Find cars in a specific regional ordered by id, paginated like find_all"""
+        pass
+
+    @abstractmethod
+    async def afind_by_id(self, id: int) -> Optional[Car]:
+        """Asynchronously find a car by id, returns None if not found"""
+        pass
+
+    @abstractmethod
+    async def afind_all(
+        self, limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> list[Car]:
+        """Asynchronously find cars, paginated like find_all"""
+        pass
+
+    @abstractmethod
+    async def afind_by_regional_id(
+        self,
+        regional_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[int] = None,
+    ) -> list[Car]:
+        """Asynchronously find cars in a specific regional, paginated like find_all"""
         pass
 
     @abstractmethod
@@ -10,22 +10,29 @@ class RegionalRepository(ABC):
         """Save a regional to the repository and return the saved regional"""
         pass
 
+    @abstractmethod
+    def insert_if_absent(self, regional: Regional) -> Optional[Regional]:
+        """Insert a regional unless the name is taken, returns None if it was"""
+        pass
+
     @abstractmethod
     def find_by_id(self, id: int) -> Optional[Regional]:
         """Find a regional by id, returns None if not found"""
         pass
 
     @abstractmethod
-    def find_all(self) -> list[Regional]:
-        """Find all regionals in the repository"""
+    def find_all(
+        self, limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> list[Regional]:
+        """Find regionals ordered by id, optionally after a cursor id and limited"""
         pass
 
     @abstractmethod
-    def update(self, regional: Regional) -> Regional:
-        """Update a regional in the repository and return the updated regional"""
+    def update_and_return(self, regional_id: int, name: str) -> Optional[Regional]:
+        """Rename a regional and return it, returns None if not found"""
         pass
 
     @abstractmethod
-    def delete(self, regional: Regional) -> None:
-        """Delete a regional from the repository"""
+    def delete_by_id(self, id: int) -> int:
+        """Delete a regional by id, returns the number of regionals deleted"""
         pass
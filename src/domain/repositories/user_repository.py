@@ -10,7 +10,22 @@ class UserRepository(ABC):
         """Save a user to the repository and return the saved user"""
         pass
 
+    @abstractmethod
+    def insert_if_absent(self, user: User) -> Optional[User]:
+        """Insert a user unless the username is taken, returns None if it was"""
+        pass
+
     @abstractmethod
     def find_by_username(self, username: str) -> Optional[User]:
         """Find a user by username, returns None if not found"""
         pass
+
+    @abstractmethod
+    def username_exists(self, username: str) -> bool:
+        """Check whether a user with the given username exists"""
+        pass
+
+    @abstractmethod
+    def update_password(self, user_id: int, hashed_password: str) -> None:
+        """Replace the stored password hash of a user"""
+        pass
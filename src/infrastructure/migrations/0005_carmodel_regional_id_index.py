@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0004_carmodel'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='carmodel',
+            index=models.Index(fields=['regional', 'id'], name='cars_regiona_f79715_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-15 03:52
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def lowercase_usernames(apps, schema_editor):
+    """Lowercase any legacy usernames so the new constraint holds
+
+    Usernames that differ only by case (e.g. "Alice" and "alice") would
+    collide on the unique username index once lowercased. Those are not
+    merged automatically: the migration stops before changing anything and
+    lists them, so the accounts can be renamed or merged by hand first.
+    """
+    UserModel = apps.get_model('infrastructure', 'UserModel')
+    collisions = (
+        UserModel.objects.values(
+            lowered=django.db.models.functions.text.Lower('username')
+        )
+        .annotate(count=models.Count('id'))
+        .filter(count__gt=1)
+        .values_list('lowered', flat=True)
+    )
+    if collisions:
+        conflicting = UserModel.objects.annotate(
+            lowered=django.db.models.functions.text.Lower('username')
+        ).filter(lowered__in=list(collisions)).order_by('lowered', 'id')
+        raise RuntimeError(
+            'Cannot lowercase usernames: these accounts differ only by case: '
+            + ', '.join(user.username for user in conflicting)
+            + '. Rename or merge them, then run the migration again.'
+        )
+
+    UserModel.objects.exclude(
+        username=django.db.models.functions.text.Lower('username')
+    ).update(username=django.db.models.functions.text.Lower('username'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0005_carmodel_regional_id_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_usernames, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='usermodel',
+            constraint=models.CheckConstraint(condition=models.Q(('username', django.db.models.functions.text.Lower('username'))), name='users_username_lowercase'),
+        ),
+    ]
@@ -19,6 +19,7 @@ class CarModel(models.Model):
         db_table = "cars"
         indexes = [
             models.Index(fields=["regional", "created_at"]),
+            models.Index(fields=["regional", "id"]),
         ]
 
     def __str__(self):
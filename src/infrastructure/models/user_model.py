@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class UserModel(models.Model):
@@ -9,6 +10,13 @@ class UserModel(models.Model):
 
     class Meta:
         db_table = "users"
+        constraints = [
+            # Usernames are stored normalized so lookups can use plain equality
+            models.CheckConstraint(
+                condition=models.Q(username=Lower("username")),
+                name="users_username_lowercase",
+            ),
+        ]
 
     def __str__(self):
         return self.username
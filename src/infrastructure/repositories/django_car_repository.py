@@ -2,8 +2,13 @@ from typing import Optional
 import logging
 
 from django.db import DatabaseError
+from django.db.models import FloatField, QuerySet
+from django.db.models.functions import Cast
+from django.utils import timezone
 
 from src.domain.entities.car import Car
+from src.domain.entities.regional import Regional
+from src.domain.exceptions import CarNotFoundError, RegionalNotFoundError
 from src.domain.repositories.car_repository import CarRepository
 from src.infrastructure.models.car_model import CarModel
 from src.infrastructure.models.regional_model import RegionalModel
@@ -11,6 +16,21 @@ from src.infrastructure.models.regional_model import RegionalModel
 
 logger = logging.getLogger(__name__)
 
+# Columns read by _row_to_entity, in tuple order, so queries fetch nothing else.
+# price_float is price_per_day cast to float by the database (see _row_queryset)
+ROW_FIELDS = (
+    "id",
+    "name",
+    "brand",
+    "model",
+    "year",
+    "plate_number",
+    "color",
+    "price_float",
+    "regional_id",
+    "regional__name",
+)
+
 
 class DjangoCarRepository(CarRepository):
     def save(self, car: Car) -> Car:
@@ -20,16 +40,17 @@ class DjangoCarRepository(CarRepository):
             car: Car entity to save
 
         Returns:
-            Car: Saved car entity with ID
+            Car: Saved car entity with ID and its regional loaded
 
         Raises:
+            RegionalNotFoundError: If regional_id does not exist
             IntegrityError: If plate number already exists (race condition)
             DatabaseError: For other database errors
         """
         try:
             regional = RegionalModel.objects.get(id=car.regional_id)
         except RegionalModel.DoesNotExist:
-            raise ValueError(f"Regional with ID {car.regional_id} not found")
+            raise RegionalNotFoundError(car.regional_id)
 
         car_model = CarModel(
             name=car.name,
@@ -43,6 +64,7 @@ class DjangoCarRepository(CarRepository):
         )
         car_model.save()
         car.id = car_model.id
+        car.regional = Regional.trusted(regional.name, regional.id)
         return car
 
     def find_by_id(self, id: int) -> Optional[Car]:
@@ -58,16 +80,22 @@ class DjangoCarRepository(CarRepository):
             DatabaseError: For database errors
         """
         try:
-            car_model = CarModel.objects.get(id=id)
-            return self._model_to_entity(car_model)
+            row = self._row_queryset().get(id=id)
+            return self._row_to_entity(row)
         except CarModel.DoesNotExist:
             return None
         except DatabaseError as e:
             logger.error(f"Database error in find_by_id: {e}")
             raise
 
-    def find_all(self) -> list[Car]:
-        """Find all cars in the database
+    def find_all(
+        self, limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> list[Car]:
+        """Find all cars in the database, ordered by ID
+
+        Args:
+            limit: Maximum number of cars to return (optional)
+            cursor: Only return cars with an ID greater than this (optional)
 
         Returns:
             List of car entities
@@ -76,17 +104,24 @@ class DjangoCarRepository(CarRepository):
             DatabaseError: For database errors
         """
         try:
-            car_models = CarModel.objects.all()
-            return [self._model_to_entity(car_model) for car_model in car_models]
+            rows = self._paginate(self._row_queryset(), limit, cursor)
+            return [self._row_to_entity(row) for row in rows]
         except DatabaseError as e:
             logger.error(f"Database error in find_all: {e}")
             raise
 
-    def find_by_regional_id(self, regional_id: int) -> list[Car]:
-        """Find all cars in a specific regional
+    def find_by_regional_id(
+        self,
+        regional_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[int] = None,
+    ) -> list[Car]:
+        """Find all cars in a specific regional, ordered by ID
 
         Args:
             regional_id: Regional ID to filter by
+            limit: Maximum number of cars to return (optional)
+            cursor: Only return cars with an ID greater than this (optional)
 
         Returns:
             List of car entities in the regional
@@ -95,12 +130,89 @@ class DjangoCarRepository(CarRepository):
             DatabaseError: For database errors
         """
         try:
-            car_models = CarModel.objects.filter(regional_id=regional_id)
-            return [self._model_to_entity(car_model) for car_model in car_models]
+            rows = self._paginate(
+                self._row_queryset().filter(regional_id=regional_id),
+                limit,
+                cursor,
+            )
+            return [self._row_to_entity(row) for row in rows]
         except DatabaseError as e:
             logger.error(f"Database error in find_by_regional_id: {e}")
             raise
 
+    async def afind_by_id(self, id: int) -> Optional[Car]:
+        """Asynchronously find a car by ID
+
+        Args:
+            id: Car ID to search for
+
+        Returns:
+            Car entity if found, None otherwise
+
+        Raises:
+            DatabaseError: For database errors
+        """
+        try:
+            row = await self._row_queryset().aget(id=id)
+            return self._row_to_entity(row)
+        except CarModel.DoesNotExist:
+            return None
+        except DatabaseError as e:
+            logger.error(f"Database error in afind_by_id: {e}")
+            raise
+
+    async def afind_all(
+        self, limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> list[Car]:
+        """Asynchronously find all cars in the database, ordered by ID
+
+        Args:
+            limit: Maximum number of cars to return (optional)
+            cursor: Only return cars with an ID greater than this (optional)
+
+        Returns:
+            List of car entities
+
+        Raises:
+            DatabaseError: For database errors
+        """
+        try:
+            rows = self._paginate(self._row_queryset(), limit, cursor)
+            return [self._row_to_entity(row) async for row in rows]
+        except DatabaseError as e:
+            logger.error(f"Database error in afind_all: {e}")
+            raise
+
+    async def afind_by_regional_id(
+        self,
+        regional_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[int] = None,
+    ) -> list[Car]:
+        """Asynchronously find all cars in a specific regional, ordered by ID
+
+        Args:
+            regional_id: Regional ID to filter by
+            limit: Maximum number of cars to return (optional)
+            cursor: Only return cars with an ID greater than this (optional)
+
+        Returns:
+            List of car entities in the regional
+
+        Raises:
+            DatabaseError: For database errors
+        """
+        try:
+            rows = self._paginate(
+                self._row_queryset().filter(regional_id=regional_id),
+                limit,
+                cursor,
+            )
+            return [self._row_to_entity(row) async for row in rows]
+        except DatabaseError as e:
+            logger.error(f"Database error in afind_by_regional_id: {e}")
+            raise
+
     def update(self, car: Car) -> Car:
         """Update a car in the database
 
@@ -108,41 +220,46 @@ class DjangoCarRepository(CarRepository):
             car: Car entity with updated values
 
         Returns:
-            Updated car entity
+            Updated car entity with its regional loaded
 
         Raises:
-            ValueError: If car not found or regional_id is invalid
+            ValueError: If car has no ID
+            CarNotFoundError: If car not found
+            RegionalNotFoundError: If regional_id does not exist
             DatabaseError: For other database errors
         """
         if not car.id:
             raise ValueError("Car must have an ID to be updated")
 
-        try:
-            car_model = CarModel.objects.get(id=car.id)
-        except CarModel.DoesNotExist:
-            raise ValueError(f"Car with ID {car.id} not found")
-
-        # Validate regional exists
-        try:
-            RegionalModel.objects.get(id=car.regional_id)
-        except RegionalModel.DoesNotExist:
-            raise ValueError(f"Regional with ID {car.regional_id} not found")
+        # Only look up the regional when it changed; otherwise the one loaded
+        # with the car already proves it exists and carries its name
+        if car.regional is None or car.regional.id != car.regional_id:
+            try:
+                regional = RegionalModel.objects.get(id=car.regional_id)
+            except RegionalModel.DoesNotExist:
+                raise RegionalNotFoundError(car.regional_id)
+            car.regional = Regional.trusted(regional.name, regional.id)
 
         try:
-            car_model.name = car.name
-            car_model.brand = car.brand
-            car_model.model = car.model
-            car_model.year = car.year
-            car_model.plate_number = car.plate_number
-            car_model.color = car.color
-            car_model.price_per_day = car.price_per_day
-            car_model.regional_id = car.regional_id
-            car_model.save()
-            return car
+            updated = CarModel.objects.filter(id=car.id).update(
+                name=car.name,
+                brand=car.brand,
+                model=car.model,
+                year=car.year,
+                plate_number=car.plate_number,
+                color=car.color,
+                price_per_day=car.price_per_day,
+                regional_id=car.regional_id,
+                updated_at=timezone.now(),
+            )
         except DatabaseError as e:
             logger.error(f"Database error in update: {e}")
             raise
 
+        if updated == 0:
+            raise CarNotFoundError(car.id)
+        return car
+
     def delete(self, car: Car) -> None:
         """Delete a car from the database
 
@@ -150,21 +267,22 @@ class DjangoCarRepository(CarRepository):
             car: Car entity to delete
 
         Raises:
-            ValueError: If car not found
+            ValueError: If car has no ID
+            CarNotFoundError: If car not found
             DatabaseError: For other database errors
         """
         if not car.id:
             raise ValueError("Car must have an ID to be deleted")
 
         try:
-            car_model = CarModel.objects.get(id=car.id)
-            car_model.delete()
-        except CarModel.DoesNotExist:
-            raise ValueError(f"Car with ID {car.id} not found")
+            deleted, _ = CarModel.objects.filter(id=car.id).delete()
         except DatabaseError as e:
             logger.error(f"Database error in delete: {e}")
             raise
 
+        if deleted == 0:
+            raise CarNotFoundError(car.id)
+
     def find_by_plate_number(self, plate_number: str) -> Optional[Car]:
         """Find a car by plate number
 
@@ -178,8 +296,8 @@ class DjangoCarRepository(CarRepository):
             DatabaseError: For database errors
         """
         try:
-            car_model = CarModel.objects.get(plate_number=plate_number)
-            return self._model_to_entity(car_model)
+            row = self._row_queryset().get(plate_number=plate_number)
+            return self._row_to_entity(row)
         except CarModel.DoesNotExist:
             return None
         except DatabaseError as e:
@@ -187,23 +305,72 @@ class DjangoCarRepository(CarRepository):
             raise
 
     @staticmethod
-    def _model_to_entity(car_model: CarModel) -> Car:
-        """Convert a CarModel to a Car entity
+    def _row_queryset() -> QuerySet:
+        """Build the base queryset for reading car entities
+
+        Yields plain tuples of ROW_FIELDS (joining the regional for its name)
+        instead of model instances. The price is cast to float in SQL so no
+        Decimal is built per row.
+        """
+        return CarModel.objects.annotate(
+            price_float=Cast("price_per_day", FloatField())
+        ).values_list(*ROW_FIELDS)
+
+    @staticmethod
+    def _paginate(
+        queryset: QuerySet, limit: Optional[int], cursor: Optional[int]
+    ) -> QuerySet:
+        """Apply keyset pagination on ID to a car queryset
+
+        Args:
+            queryset: Car queryset to paginate
+            limit: Maximum number of rows to return (optional)
+            cursor: Only return rows with an ID greater than this (optional)
+
+        Returns:
+            Queryset ordered by ID with the cursor and limit applied
+        """
+        queryset = queryset.order_by("id")
+        if cursor is not None:
+            queryset = queryset.filter(id__gt=cursor)
+        if limit is not None:
+            queryset = queryset[:limit]
+        return queryset
+
+    @staticmethod
+    def _row_to_entity(row: tuple) -> Car:
+        """Convert a ROW_FIELDS tuple to a Car entity
+
+        Stored rows were validated on write, so the entity is built without
+        re-running Car validation.
 
         Args:
-            car_model: Django model instance
+            row: Values in ROW_FIELDS order
 
         Returns:
-            Car entity
+            Car entity with its regional loaded
         """
-        return Car(
-            id=car_model.id,
-            name=car_model.name,
-            brand=car_model.brand,
-            model=car_model.model,
-            year=car_model.year,
-            plate_number=car_model.plate_number,
-            color=car_model.color,
-            price_per_day=float(car_model.price_per_day),
-            regional_id=car_model.regional_id,
+        (
+            id,
+            name,
+            brand,
+            model,
+            year,
+            plate_number,
+            color,
+            price_per_day,
+            regional_id,
+            regional_name,
+        ) = row
+        return Car.trusted(
+            id=id,
+            name=name,
+            brand=brand,
+            model=model,
+            year=year,
+            plate_number=plate_number,
+            color=color,
+            price_per_day=price_per_day,
+            regional_id=regional_id,
+            regional=Regional.trusted(regional_name, regional_id),
         )
@@ -1,7 +1,7 @@
 from typing import Optional
 import logging
 
-from django.db import DatabaseError
+from django.db import DatabaseError, connection
 
 from src.domain.entities.regional import Regional
 from src.domain.repositories.regional_repository import RegionalRepository
@@ -30,6 +30,34 @@ class DjangoRegionalRepository(RegionalRepository):
         regional.id = regional_model.id
         return regional
 
+    def insert_if_absent(self, regional: Regional) -> Optional[Regional]:
+        """Insert a regional in one statement, skipping it if the name is taken
+
+        Uses INSERT ... ON CONFLICT DO NOTHING RETURNING, so a duplicate
+        name neither raises nor needs a separate existence query.
+
+        Args:
+            regional: Regional entity to insert
+
+        Returns:
+            Regional: Saved regional entity with ID, or None if the name already exists
+
+        Raises:
+            DatabaseError: For database errors
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {RegionalModel._meta.db_table} (name) "
+                "VALUES (%s) "
+                "ON CONFLICT (name) DO NOTHING RETURNING id",
+                [regional.name],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        regional.id = row[0]
+        return regional
+
     def find_by_id(self, id: int) -> Optional[Regional]:
         """Find a regional by id (case-insensitive)
 
@@ -40,35 +68,66 @@ class DjangoRegionalRepository(RegionalRepository):
             Regional entity if found, None otherwise
         """
         try:
-            # Use iexact for case-insensitive lookup
-            regional_model = RegionalModel.objects.get(id=id)
-            return Regional(
-                id=regional_model.id,
-                name=regional_model.name,
+            # first() returns None on a miss instead of raising DoesNotExist
+            name = (
+                RegionalModel.objects.filter(id=id)
+                .values_list("name", flat=True)
+                .first()
             )
-        except RegionalModel.DoesNotExist:
-            return None
         except DatabaseError as e:
             # Log database errors for debugging while returning None to prevent exposure
             logger.error(f"Database error in find_by_id: {e}")
             return None
+        if name is None:
+            return None
+        return Regional.trusted(name, id)
 
-    def find_all(self) -> list[Regional]:
-        """Find all regionals in the repository"""
-        regional_models = RegionalModel.objects.all()
-        return [
-            Regional(id=regional_model.id, name=regional_model.name)
-            for regional_model in regional_models
-        ]
-
-    def update(self, regional: Regional) -> Regional:
-        """Update a regional entity in the database"""
-        regional_model = RegionalModel.objects.get(id=regional.id)
-        regional_model.name = regional.name
-        regional_model.save()
-        return regional
+    def find_all(
+        self, limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> list[Regional]:
+        """Find regionals ordered by id using keyset pagination
+
+        Args:
+            limit: Maximum number of regionals to return (optional)
+            cursor: Only return regionals with an id greater than this (optional)
 
-    def delete(self, regional: Regional) -> None:
-        """Delete a regional entity from the database"""
-        regional_model = RegionalModel.objects.get(id=regional.id)
-        regional_model.delete()
+        Returns:
+            List of regional entities
+        """
+        rows = RegionalModel.objects.values_list("id", "name").order_by("id")
+        if cursor is not None:
+            rows = rows.filter(id__gt=cursor)
+        if limit is not None:
+            rows = rows[:limit]
+        return [Regional.trusted(name, id) for id, name in rows]
+
+    def update_and_return(self, regional_id: int, name: str) -> Optional[Regional]:
+        """Rename a regional with a single UPDATE statement
+
+        Args:
+            regional_id: id of the regional to update
+            name: New, already validated name
+
+        Returns:
+            Updated Regional entity, or None if no regional has that id
+
+        Raises:
+            IntegrityError: If another regional already has that name
+            DatabaseError: For other database errors
+        """
+        updated = RegionalModel.objects.filter(id=regional_id).update(name=name)
+        if updated == 0:
+            return None
+        return Regional.trusted(name, regional_id)
+
+    def delete_by_id(self, id: int) -> int:
+        """Delete a regional by id without loading it first
+
+        Args:
+            id: id of the regional to delete
+
+        Returns:
+            Number of regionals deleted (0 if it did not exist)
+        """
+        _, deleted_per_model = RegionalModel.objects.filter(id=id).delete()
+        return deleted_per_model.get(RegionalModel._meta.label, 0)
@@ -1,9 +1,10 @@
 from typing import Optional
 import logging
 
-from django.db import DatabaseError, IntegrityError
+from django.db import DatabaseError, IntegrityError, connection
+from django.utils import timezone
 
-from src.domain.entities.user import User
+from src.domain.entities.user import User, normalize_username
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.models.user_model import UserModel
 
@@ -25,11 +26,43 @@ class DjangoUserRepository(UserRepository):
             IntegrityError: If username already exists (race condition)
             DatabaseError: For other database errors
         """
-        user_model = UserModel(username=user.username, password=user.password)
+        user_model = UserModel(
+            username=normalize_username(user.username), password=user.password
+        )
         user_model.save()
         user.id = user_model.id
         return user
 
+    def insert_if_absent(self, user: User) -> Optional[User]:
+        """Insert a user in one statement, skipping it if the username is taken
+
+        Uses INSERT ... ON CONFLICT DO NOTHING RETURNING, so a duplicate
+        username neither raises nor needs a separate existence query.
+
+        Args:
+            user: User entity to insert
+
+        Returns:
+            User: Saved user entity with ID, or None if the username already exists
+
+        Raises:
+            DatabaseError: For database errors
+        """
+        now = timezone.now()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {UserModel._meta.db_table} "
+                "(username, password, created_at, updated_at) "
+                "VALUES (%s, %s, %s, %s) "
+                "ON CONFLICT (username) DO NOTHING RETURNING id",
+                [normalize_username(user.username), user.password, now, now],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        user.id = row[0]
+        return user
+
     def find_by_username(self, username: str) -> Optional[User]:
         """Find a user by username (case-insensitive)
 
@@ -39,18 +72,60 @@ class DjangoUserRepository(UserRepository):
         Returns:
             User entity if found, None otherwise
         """
+        # Usernames are stored normalized, so an exact match on the
+        # normalized name is case-insensitive and can use the unique index
+        username = normalize_username(username)
         try:
-            # Use iexact for case-insensitive lookup
-            user_model = UserModel.objects.get(username__iexact=username)
-            return User(
-                id=user_model.id,
-                username=user_model.username,
-                password=user_model.password,
-                is_hashed=True,  # Skip password validation for DB-loaded users
+            # first() returns None on a miss instead of raising DoesNotExist
+            row = (
+                UserModel.objects.filter(username=username)
+                .values_list("id", "password")
+                .first()
             )
-        except UserModel.DoesNotExist:
-            return None
         except DatabaseError as e:
             # Log database errors for debugging while returning None to prevent exposure
             logger.error(f"Database error in find_by_username: {e}")
             return None
+        if row is None:
+            return None
+        id, password = row
+        return User(
+            id=id,
+            username=username,
+            password=password,
+            is_hashed=True,  # Skip password validation for DB-loaded users
+        )
+
+    def username_exists(self, username: str) -> bool:
+        """Check whether a username is taken (case-insensitive)
+
+        Runs an EXISTS query on the unique index without loading the row.
+
+        Args:
+            username: Username to check
+
+        Returns:
+            True if a user with that username exists, False otherwise
+        """
+        try:
+            return UserModel.objects.filter(
+                username=normalize_username(username)
+            ).exists()
+        except DatabaseError as e:
+            # Log database errors for debugging while returning False to prevent exposure
+            logger.error(f"Database error in username_exists: {e}")
+            return False
+
+    def update_password(self, user_id: int, hashed_password: str) -> None:
+        """Replace the stored password hash of a user
+
+        Args:
+            user_id: ID of the user to update
+            hashed_password: New password hash
+
+        Raises:
+            DatabaseError: If the update fails
+        """
+        UserModel.objects.filter(id=user_id).update(
+            password=hashed_password, updated_at=timezone.now()
+        )